@@ -1,6 +1,6 @@
 import argparse
 import json
-from .analyzer import parse_file, filter_time, summarize
+from .analyzer import parse_file, filter_time, summarize, summarize_file
 import datetime
 
 
@@ -15,13 +15,16 @@ def main():
     p.add_argument("--start", help="Start time (ISO) e.g. 2020-01-01T00:00:00")
     p.add_argument("--end", help="End time (ISO)")
     p.add_argument("--json", action="store_true", help="Output JSON summary")
+    p.add_argument("--workers", "-j", type=int, default=1, help="Processes to summarize with (0 = one per CPU)")
     args = p.parse_args()
 
-    entries = list(parse_file(args.file))
     start = iso_to_dt(args.start) if args.start else None
     end = iso_to_dt(args.end) if args.end else None
-    entries = filter_time(iter(entries), start=start, end=end)
-    summary = summarize(entries, top=args.top)
+    if args.workers == 1:
+        entries = filter_time(parse_file(args.file), start=start, end=end)
+        summary = summarize(entries, top=args.top)
+    else:
+        summary = summarize_file(args.file, top=args.top, workers=args.workers or None, start=start, end=end)
     if args.json:
         print(json.dumps(summary, default=str, indent=2))
     else:
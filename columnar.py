@@ -0,0 +1,187 @@
+import numpy as np  # import numpy for columnar arrays and vectorized aggregation (optional dependency)
+from typing import Dict, List, Optional, Sequence, Tuple  # import type hints used in function signatures
+try:  # hyperscan is optional: it batch-scans paths for the HIGH patterns in one pass
+    import hyperscan  # import the Hyperscan multi-pattern matcher
+except ImportError:  # not installed
+    hyperscan = None  # fall back to checking paths one by one in Python
+try:  # numba is optional: it JIT-compiles the aggregation into one native loop
+    import numba  # import the numba JIT compiler
+except ImportError:  # not installed
+    numba = None  # fall back to numpy's per-column passes
+from .analyzer import Entry, parse_file, _suspicious_path  # reuse the row parser and the path severity rule
+
+SEVERITY_LABELS = ("LOW", "MED", "HIGH")  # severity names indexed by severity code
+KNOWN_METHODS = ("GET", "POST", "HEAD")  # methods that do not by themselves raise severity to MED
+HIGH_PATH_LITERALS = (b"/admin", b"/phpmyadmin", b"--", b"%27", b"%3d")  # lowercased tokens that alone make _suspicious_path true
+SQLI_CANDIDATES = (rb"union[^\x00]+select", rb"(?:or|and)[^\x00]+=")  # supersets of SQLI_RE's regex-only branches; hits are confirmed in Python
+_hs_db = None  # compiled Hyperscan database, built on first use
+
+def _hyperscan_db():  # compile the literal and candidate patterns once into one matcher
+    global _hs_db  # cached across calls
+    if _hs_db is None:  # first use
+        patterns = list(HIGH_PATH_LITERALS) + list(SQLI_CANDIDATES)  # literals first (no regex metacharacters in them), so id < len(HIGH_PATH_LITERALS) is decisive
+        db = hyperscan.Database()  # block-mode database
+        db.compile(expressions=patterns, ids=list(range(len(patterns))), elements=len(patterns), flags=[0] * len(patterns))  # one multi-pattern matcher
+        _hs_db = db  # cache it
+    return _hs_db  # the compiled database
+
+def _scan_ascii(paths: Sequence[str]) -> np.ndarray:  # Hyperscan pass over ASCII-only paths, as a bool array
+    buf = "\0".join(paths).lower().encode("ascii")  # all paths lowercased in one buffer; no pattern can match across a "\0"
+    lengths = np.fromiter(map(len, paths), dtype=np.int64, count=len(paths))  # byte length of each path (one byte per character)
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))  # byte offset where each path starts in the joined buffer
+    hits = []  # (pattern id, end offset) of every match
+    _hyperscan_db().scan(buf, match_event_handler=lambda id_, _from, to, _flags, _ctx: hits.append((id_, to)))  # one pass over all paths
+    flags = np.zeros(len(paths), dtype=bool)  # nothing flagged yet
+    if not hits:  # clean batch
+        return flags  # no path matched anything
+    ids, ends = np.array(hits, dtype=np.int64).T  # split ids and end offsets
+    owner = np.searchsorted(starts, ends - 1, side="right") - 1  # path containing each match's last byte
+    decisive = ids < len(HIGH_PATH_LITERALS)  # literal hits settle the path outright
+    flags[owner[decisive]] = True  # flag those paths
+    for i in np.unique(owner[~decisive]):  # paths with only a candidate SQLi hit
+        if not flags[i]:  # not already flagged by a literal
+            flags[i] = _suspicious_path(paths[i])  # confirm with the exact regex
+    return flags  # one flag per path
+
+def _suspicious_flags(paths: Sequence[str]) -> np.ndarray:  # _suspicious_path for many paths at once, as a bool array
+    if hyperscan is None or not len(paths):  # no batch matcher (or nothing to scan)
+        return np.array([_suspicious_path(p) for p in paths], dtype=bool)  # check each path in Python
+    if "\0".join(paths).isascii():  # common case: every path is plain ASCII
+        return _scan_ascii(paths)  # one Hyperscan pass
+    is_ascii = np.array([p.isascii() for p in paths], dtype=bool)  # SQLI_RE's IGNORECASE folds ı/İ/ſ, which byte patterns cannot see
+    flags = np.zeros(len(paths), dtype=bool)  # filled in below
+    if is_ascii.any():  # scan the ASCII paths in one pass
+        flags[is_ascii] = _scan_ascii([p for p in paths if p.isascii()])  # same order as the mask
+    for i in np.flatnonzero(~is_ascii):  # the rest go through the exact per-path rule
+        flags[i] = _suspicious_path(paths[i])  # cached regex check
+    return flags  # one flag per path
+
+def _severity_status(status) -> int:  # value the severity rules see for a status outside the 0-999 integer histogram
+    if type(status) is float and 0 <= status < 1000:  # e.g. 503.0 from a JSON line: same 4xx/5xx band as its integer part
+        return int(status)  # truncate into the int16 column
+    return -1  # missing, negative, >= 1000 or not a number: never 4xx/5xx
+
+def _to_columns(batch: List[Entry], ip_codes: Dict, path_codes: Dict, method_codes: Dict, status_codes: Dict) -> Dict[str, np.ndarray]:  # turn one batch of entries into column arrays (strings become int32 codes in first-seen order)
+    statuses = [e.status for e in batch]  # raw status values (int from CLF, anything from JSON)
+    return {  # one array per field used by summarize_columnar
+        "ip": np.array([ip_codes.setdefault(e.ip, len(ip_codes)) if e.ip else -1 for e in batch], dtype=np.int32),  # IP codes, -1 when missing
+        "path": np.array([path_codes.setdefault(e.path or "-", len(path_codes)) for e in batch], dtype=np.int32),  # path codes, "-" when missing
+        "status": np.array([s if type(s) is int and 0 <= s < 1000 else _severity_status(s) for s in statuses], dtype=np.int16),  # HTTP status for the severity rules, -1 when missing/out of range
+        "status_other": np.array([-1 if s is None or (type(s) is int and 0 <= s < 1000) else status_codes.setdefault(str(s), len(status_codes)) for s in statuses], dtype=np.int32),  # codes of statuses outside the 0-999 integers (keyed by str(), like summarize), -1 otherwise
+        "size": np.array([e.size or 0 for e in batch], dtype=np.int64),  # response sizes, 0 when missing
+        "method": np.array([method_codes.setdefault(e.method, len(method_codes)) for e in batch], dtype=np.int32),  # method codes (None is a value too)
+    }  # end of column dict
+
+def parse_file_columnar(path: str, batch_size: int = 100_000) -> Dict[str, np.ndarray]:  # parse a log file into column arrays (struct of arrays)
+    ip_codes = {}  # IP string -> code
+    path_codes = {}  # path string -> code
+    method_codes = {}  # method string -> code
+    status_codes = {}  # str() of an out-of-range/non-integer status -> code
+    batches = []  # finished column batches
+    batch = []  # entries of the batch being filled
+    for e in parse_file(path):  # stream parsed entries from the file
+        batch.append(e if isinstance(e, Entry) else Entry.from_mapping(e))  # normalize JSON dicts to the Entry layout
+        if len(batch) >= batch_size:  # batch is full
+            batches.append(_to_columns(batch, ip_codes, path_codes, method_codes, status_codes))  # convert it to arrays
+            batch = []  # start a new batch
+    batches.append(_to_columns(batch, ip_codes, path_codes, method_codes, status_codes))  # convert the last (possibly empty) batch
+    cols = {k: np.concatenate([b[k] for b in batches]) for k in batches[0]}  # join batches column by column
+    cols["ip_values"] = np.array(list(ip_codes), dtype=object)  # code -> IP string
+    cols["path_values"] = np.array(list(path_codes), dtype=object)  # code -> path string
+    cols["method_values"] = np.array(list(method_codes), dtype=object)  # code -> method string
+    cols["status_other_values"] = np.array(list(status_codes), dtype=object)  # code -> out-of-range status string
+    return cols  # columns plus their string dictionaries
+
+def _top_counts(counts: np.ndarray, values: np.ndarray, top: Optional[int]) -> List[Tuple]:  # top-N (value, count) pairs from per-code counts (top=None: all)
+    if top is None:  # every value, like summarize
+        top = len(counts)  # no cut
+    if top <= 0:  # nothing to rank
+        return []  # same as heapq.nlargest for top <= 0
+    keep = np.flatnonzero(counts)  # codes that occur at all
+    if top < len(keep):  # only part of the values are needed
+        kth = np.partition(counts[keep], len(keep) - top)[len(keep) - top]  # the top-th largest count
+        keep = keep[counts[keep] >= kth]  # every code that can make the cut (ties included)
+    order = keep[np.lexsort((keep, -counts[keep]))][:top]  # by count desc, then code (= first-seen order, like summarize)
+    return [(values[i], int(counts[i])) for i in order]  # plain Python (value, count) pairs
+
+def _code_flags(cols: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:  # severity inputs that depend only on the path/method value, one flag per code
+    method_values = cols["method_values"]  # code -> method
+    suspicious = _suspicious_flags(cols["path_values"])  # path rule evaluated once per distinct path
+    is_post = np.array([m == "POST" for m in method_values], dtype=bool)  # per method code: method is POST
+    known = np.array([m in KNOWN_METHODS for m in method_values], dtype=bool)  # per method code: method is GET/POST/HEAD (None included, so no np.isin sort)
+    return suspicious, is_post, known  # indexed by path code, method code, method code
+
+def severity_codes(cols: Dict[str, np.ndarray]) -> np.ndarray:  # vectorized score_severity: 0/1/2 (LOW/MED/HIGH) per entry
+    status = cols["status"]  # HTTP status, -1 when missing
+    suspicious, is_post, known = _code_flags(cols)  # per-code flags
+    is_post = is_post[cols["method"]]  # per entry: method is POST
+    known = known[cols["method"]]  # per entry: method is GET/POST/HEAD
+    high = suspicious[cols["path"]] | ((status >= 500) & (status < 600)) | (is_post & (cols["size"] > 1_000_000))  # HIGH: suspicious paths, 5xx errors, large POSTs
+    med = ~high & (((status >= 400) & (status < 500)) | ~known)  # MED: 4xx errors or unusual methods
+    return (2 * high + med).astype(np.int8)  # LOW=0, MED=1, HIGH=2
+
+def _aggregate_loop(ip, path, status, status_other, size, method, suspicious, is_post, known, n_ips, n_paths, n_status, n_other):  # every count summarize_columnar needs, in one pass (numba-compiled when available)
+    ip_counts = np.zeros(n_ips, np.int64)  # occurrences of each IP code
+    path_counts = np.zeros(n_paths, np.int64)  # occurrences of each path code
+    status_hist = np.zeros(n_status, np.int64)  # occurrences of each status code
+    other_counts = np.zeros(n_other, np.int64)  # occurrences of each out-of-range status code
+    severity_counts = np.zeros(3, np.int64)  # occurrences of LOW/MED/HIGH
+    bytes_total = 0  # running sum of response sizes
+    for i in range(len(status)):  # one iteration per entry
+        if ip[i] >= 0:  # skip missing IPs
+            ip_counts[ip[i]] += 1  # count this IP
+        path_counts[path[i]] += 1  # count this path
+        s = status[i]  # HTTP status, -1 when missing
+        if status_other[i] >= 0:  # outside the 0-999 integers
+            other_counts[status_other[i]] += 1  # count it under its string form
+        elif s >= 0:  # skip missing statuses
+            status_hist[s] += 1  # count this status
+        bytes_total += size[i]  # add the size
+        if suspicious[path[i]] or (s >= 500 and s < 600) or (is_post[method[i]] and size[i] > 1_000_000):  # HIGH rules
+            severity_counts[2] += 1  # HIGH
+        elif (s >= 400 and s < 500) or not known[method[i]]:  # MED rules
+            severity_counts[1] += 1  # MED
+        else:  # everything else
+            severity_counts[0] += 1  # LOW
+    return ip_counts, path_counts, status_hist, other_counts, severity_counts, bytes_total  # raw counts
+
+if numba is not None:  # compile the loop once per machine (cached on disk next to this module)
+    _aggregate_loop = numba.njit(cache=True, nogil=True)(_aggregate_loop)  # native code; array bounds come from the sizes passed in
+
+def _aggregate(cols: Dict[str, np.ndarray]) -> Tuple:  # (ip_counts, path_counts, status_hist, other_counts, severity_counts, bytes_total)
+    status = cols["status"]  # HTTP status, -1 when missing
+    other = cols["status_other"]  # out-of-range status codes, -1 when in range/missing
+    if numba is not None:  # fused single pass in native code
+        suspicious, is_post, known = _code_flags(cols)  # per-code flags the loop looks up
+        n_status = int(status.max()) + 1 if len(status) else 0  # histogram size covering every status present
+        return _aggregate_loop(cols["ip"], cols["path"], status, other, cols["size"], cols["method"], suspicious, is_post, known,  # the columns
+                               len(cols["ip_values"]), len(cols["path_values"]), max(n_status, 0), len(cols["status_other_values"]))  # array sizes
+    ip = cols["ip"]  # IP codes
+    ip_counts = np.bincount(ip[ip >= 0], minlength=len(cols["ip_values"]))  # occurrences of each IP code
+    path_counts = np.bincount(cols["path"], minlength=len(cols["path_values"]))  # occurrences of each path code
+    status_hist = np.bincount(status[(status >= 0) & (other < 0)])  # occurrences of each status code, indexed by code
+    other_counts = np.bincount(other[other >= 0], minlength=len(cols["status_other_values"]))  # occurrences of each out-of-range status code
+    severity_counts = np.bincount(severity_codes(cols), minlength=len(SEVERITY_LABELS))  # occurrences of each severity code
+    return ip_counts, path_counts, status_hist, other_counts, severity_counts, int(cols["size"].sum())  # one numpy pass per column
+
+def summarize_columnar(cols: Dict[str, np.ndarray], top: Optional[int] = 10) -> Dict:  # same summary as analyzer.summarize, computed over column arrays
+    ip_counts, path_counts, status_hist, other_counts, severity_counts, bytes_total = _aggregate(cols)  # all counts
+    statuses = {str(c): int(status_hist[c]) for c in np.flatnonzero(status_hist)}  # status code counts keyed by string
+    for c in np.flatnonzero(other_counts):  # fold in the out-of-range statuses, as summarize does
+        key = cols["status_other_values"][c]  # str() of the status
+        statuses[key] = statuses.get(key, 0) + int(other_counts[c])  # add to any existing count for that key
+    return {  # return a dictionary with summary metrics
+        "total_lines": len(cols["status"]),  # total parsed lines
+        "unique_ips": int(np.count_nonzero(ip_counts)),  # number of unique IPs seen
+        "top_ips": _top_counts(ip_counts, cols["ip_values"], top),  # top N IPs by count
+        "top_paths": _top_counts(path_counts, cols["path_values"], top),  # top N requested paths by count
+        "status_counts": statuses,  # status code counts as a plain dict
+        "bytes_total": int(bytes_total),  # total bytes transferred
+        "severity_counts": {SEVERITY_LABELS[i]: int(n) for i, n in enumerate(severity_counts) if n},  # counts of LOW/MED/HIGH severities
+    }  # end of summary dict
+
+__all__ = [  # define public API symbols for "from columnar import *"
+    "parse_file_columnar",  # exported symbol parse_file_columnar
+    "summarize_columnar",  # exported symbol summarize_columnar
+    "severity_codes",  # exported symbol severity_codes
+]  # end of __all__
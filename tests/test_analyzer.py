@@ -1,12 +1,31 @@
-from log_analyzer.analyzer import parse_line, summarize
+import datetime
+
+import pytest
+
+from log_analyzer import analyzer
+from log_analyzer.analyzer import parse_line, parse_file, summarize, summarize_file, score_severity, filter_time
 
 
 def test_parse_common_line():
     line = '127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] "GET /index.html HTTP/1.0" 200 2326'
     e = parse_line(line)
-    assert e["ip"] == "127.0.0.1"
-    assert e["method"] == "GET"
-    assert e["path"] == "/index.html"
+    assert e.ip == "127.0.0.1"
+    assert e.method == "GET"
+    assert e.path == "/index.html"
+    assert e.time == datetime.datetime(2000, 10, 10, 13, 55, 36)
+    assert e.get("status") == 200
+
+
+@pytest.mark.parametrize("stamp, expected", [
+    ("1/Oct/2000:13:55:36 -0700", datetime.datetime(2000, 10, 1, 13, 55, 36)),
+    ("10/oct/2000:13:55:36 -0700", datetime.datetime(2000, 10, 10, 13, 55, 36)),
+    ("+1/Oct/2000:13:55:36 -0700", None),
+    ("10/Oct/2000:-0:55:36 -0700", None),
+    ("\u0661\u0660/Oct/2000:13:55:36 -0700", None),
+])
+def test_parse_clf_time_falls_back_to_strptime(stamp, expected):
+    e = parse_line(f'127.0.0.1 - - [{stamp}] "GET / HTTP/1.0" 200 1')
+    assert e.time == expected
 
 
 def test_summarize_small():
@@ -18,3 +37,72 @@ def test_summarize_small():
     s = summarize(lines, top=2)
     assert s['total_lines'] == 3
     assert s['bytes_total'] == 15
+
+
+def test_summarize_status_counts():
+    lines = [
+        {'ip': '1.1.1.1', 'status': 200},
+        {'ip': '2.2.2.2', 'status': 404},
+        {'ip': '1.1.1.1', 'status': 200},
+        {'ip': '3.3.3.3', 'status': None},
+    ]
+    assert summarize(lines)['status_counts'] == {'200': 2, '404': 1}
+    odd = lines + [{'ip': '3.3.3.3', 'status': 1200}, {'ip': '3.3.3.3', 'status': -1}, {'ip': '3.3.3.3', 'status': 200.0}]
+    assert summarize(odd)['status_counts'] == {'200': 2, '404': 1, '1200': 1, '-1': 1, '200.0': 1}
+
+
+def test_summarize_top_n():
+    lines = [
+        {'ip': '3.3.3.3', 'path': '/c', 'status': 200},
+        {'ip': '1.1.1.1', 'path': '/a', 'status': 200},
+        {'ip': '1.1.1.1', 'path': '/a', 'status': 200},
+        {'ip': '2.2.2.2', 'path': '/b', 'status': 200},
+        {'ip': '3.3.3.3', 'path': '/b', 'status': 200},
+    ]
+    assert summarize(lines, top=1)['top_ips'] == [('3.3.3.3', 2)]
+    assert summarize(lines, top=2)['top_paths'] == [('/a', 2), ('/b', 2)]
+    assert summarize(lines, top=None)['top_ips'] == [('3.3.3.3', 2), ('1.1.1.1', 2), ('2.2.2.2', 1)]
+    assert summarize(lines, top=0)['top_ips'] == []
+
+
+def test_score_severity():
+    assert score_severity({'path': '/item?id=1 UNION SELECT pw', 'method': 'GET', 'status': 200}) == "HIGH"
+    assert score_severity({'path': '/q?x=%27', 'method': 'GET', 'status': 200}) == "HIGH"
+    assert score_severity({'path': '/x?unıon select', 'method': 'GET', 'status': 200}) == "HIGH"
+    assert score_severity({'path': '/index.html', 'method': 'GET', 'status': 404}) == "MED"
+    assert score_severity({'path': '/index.html', 'method': 'GET', 'status': 200}) == "LOW"
+
+
+def test_summarize_streams_filtered_entries():
+    lines = [
+        {'ip': '1.1.1.1', 'path': '/a', 'status': 200, 'size': 10, 'time': datetime.datetime(2020, 1, 1)},
+        {'ip': '2.2.2.2', 'path': '/b', 'status': 200, 'size': 20, 'time': datetime.datetime(2021, 1, 1)},
+        {'ip': '3.3.3.3', 'path': '/c', 'status': 200, 'size': 40},
+    ]
+    entries = filter_time(iter(lines), start=datetime.datetime(2020, 6, 1))
+    s = summarize(entries)
+    assert s['total_lines'] == 2
+    assert s['bytes_total'] == 60
+
+
+def test_summarize_file_in_chunks_matches_summarize(tmp_path):
+    log = tmp_path / "access.log"
+    log.write_bytes("".join(
+        f'10.0.0.{i % 7} - - [10/Oct/2000:13:55:{i % 60:02d} -0700] "GET /p{i % 5} HTTP/1.0" {200 + (i % 3) * 100} {i}' + ("\n", "\r", "\r\n")[i % 3]
+        for i in range(200)
+    ).encode("utf-8"))
+    assert summarize_file(str(log), top=3, workers=3) == summarize(parse_file(str(log)), top=3)
+
+
+@pytest.mark.parametrize("content", ["a\nbb\n\nccc\ndé\n", "a\nbb\nccc", "a\r\nbb\r\n\r\nccc\r\n", "a\r\nbb\r\nccc",
+                                     "a\rbb\r\rccc\r", "a\rbb\nccc\r\nd\re"])
+@pytest.mark.parametrize("read_size", [1, 2, 3, 7])
+def test_read_lines_rejoins_blocks(tmp_path, monkeypatch, content, read_size):
+    log = tmp_path / "access.log"
+    log.write_bytes(content.encode("utf-8"))
+    monkeypatch.setattr(analyzer, "_READ_SIZE", read_size)
+    with open(log, encoding="utf-8") as f:
+        expected = [line.rstrip("\n") for line in f]
+    for n in (1, 2, 4):
+        lines = [line for lo, hi in analyzer._chunk_bounds(str(log), n) for line in analyzer._read_lines(str(log), lo, hi)]
+        assert lines == expected
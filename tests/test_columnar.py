@@ -0,0 +1,35 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from log_analyzer.analyzer import parse_file, summarize, _suspicious_path
+from log_analyzer import columnar
+from log_analyzer.columnar import parse_file_columnar, summarize_columnar, _suspicious_flags
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_summarize_columnar_matches_summarize(tmp_path, monkeypatch, jit):
+    if jit and columnar.numba is None:
+        pytest.skip("numba not installed")
+    if not jit:
+        monkeypatch.setattr(columnar, "numba", None)
+    log = tmp_path / "access.log"
+    log.write_text(
+        '1.1.1.1 - - [10/Oct/2000:13:55:36 -0700] "GET /a HTTP/1.0" 200 10\n'
+        '2.2.2.2 - - [10/Oct/2000:13:55:37 -0700] "GET /admin HTTP/1.0" 404 -\n'
+        '1.1.1.1 - - [10/Oct/2000:13:55:38 -0700] "POST /b?id=1+or+1=1 HTTP/1.0" 500 7\n'
+        '3.3.3.3 - - [10/Oct/2000:13:55:39 -0700] "PUT /b HTTP/1.0" 201 3\n'
+        '{"ip": "2.2.2.2", "path": "/a", "status": 200, "size": 1, "method": "GET"}\n'
+        '{"ip": "4.4.4.4", "path": "/c", "status": 40000, "size": 2, "method": "GET"}\n'
+        '{"ip": "4.4.4.4", "path": "/c", "status": -5, "method": "GET"}\n'
+        '{"ip": "2.2.2.2", "path": "/c", "status": 503.0, "method": "GET"}\n'
+    )
+    cols = parse_file_columnar(str(log), batch_size=2)
+    assert summarize_columnar(cols, top=2) == summarize(parse_file(str(log)), top=2)
+
+
+def test_suspicious_flags_match_per_path_rule():
+    paths = ["/", "/ADMIN/x", "/phpmyadmin", "/q?id=1 or 1=1", "/q?id=1 color 1=1", "/a-b", "/a--b",
+             "/x?u=Union  Select", "/%3D", "/café?x=1", "-", "/union", "/q?x=%27",
+             "/x?union ſelect", "/x?unıon select"]
+    assert _suspicious_flags(paths).tolist() == [_suspicious_path(p) for p in paths]